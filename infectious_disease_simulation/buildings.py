@@ -83,7 +83,14 @@ class Building(ABC):
 class House(Building):
     """
     A class representing a house, inherits from Building.
+
+    Attributes:
+        COLOUR (tuple[int, int, int]): The colour of every house.
+        TILE_VALUE (int): The tile value of every house in the tilemap.
     """
+    COLOUR: tuple[int, int, int] = (100, 200, 100)
+    TILE_VALUE: int = 1
+
     def __init__(self, location: tuple[int, int]) -> None:
         """
         Initialises the House class with the given location.
@@ -91,15 +98,22 @@ class House(Building):
         Args:
             location (tuple[int, int]): The location of the house.
         """
-        super().__init__(location, (100, 200, 100))
+        super().__init__(location, self.COLOUR)
 
     def get_tile_value(self) -> int:
-        return 1
+        return self.TILE_VALUE
 
 class Office(Building):
     """
     A class representing an office, inherits from Building.
+
+    Attributes:
+        COLOUR (tuple[int, int, int]): The colour of every office.
+        TILE_VALUE (int): The tile value of every office in the tilemap.
     """
+    COLOUR: tuple[int, int, int] = (100, 100, 200)
+    TILE_VALUE: int = 2
+
     def __init__(self, location: tuple[int, int]) -> None:
         """
         Initialises the Office class with the given location.
@@ -107,7 +121,7 @@ class Office(Building):
         Args:
             location (tuple[int, int]): The location of the office.
         """
-        super().__init__(location, (100, 100, 200))
+        super().__init__(location, self.COLOUR)
     
     def get_tile_value(self) -> int:
-        return 2
+        return self.TILE_VALUE
@@ -28,7 +28,9 @@ class Clock:
         __running (bool): The state of the simulation (running or not).
         __seconds_per_hour (float): The number of real-world seconds per simulation hour.
         __fps (int): The frames per second for the simulation display.
-        __font (pygame.font.Font): The font used to display time.
+        __font (pygame.font.Font | None): The font used to display time, loaded on first use.
+        __time_text (str | None): The text most recently rendered for the time display.
+        __text_surface (pygame.Surface | None): The rendered surface of __time_text.
         __display (display.Display): The display surface for the simulation.
         __population (population.Population): The population being simulated.
         __last_update (float): The last time the simulation was updated.
@@ -51,8 +53,9 @@ class Clock:
         self.__running: bool = True
         self.__seconds_per_hour: float = seconds_per_hour
         self.__fps: int = fps
-        pygame.font.init()
-        self.__font: pygame.font.Font = pygame.font.SysFont('Arial Bold', 25)
+        self.__font: pygame.font.Font | None = None # SysFont lookup is slow, so deferred until first drawn
+        self.__time_text: str | None = None
+        self.__text_surface: pygame.Surface | None = None
         self.__display: display.Display = display_obj
         self.__population: population.Population = population_obj
         self.__last_update: float = time.time()
@@ -96,17 +99,27 @@ class Clock:
 
             self.__last_update = current_time
 
-    def display_time(self) -> None:
+    def display_time(self) -> pygame.Rect:
         """
         Displays the current time on the simulation display.
+
+        Returns:
+            pygame.Rect: The area of the display drawn on.
         """
         if self.__running:
             time_text: str = f"Day: {self.__day}, Hour: {self.__hour}"
         else:
             time_text: str = "Simulation Ended"
 
-        text_surface: display.Display = self.__font.render(time_text, True, (0, 0, 0))
-        self.__display.get_screen().blit(text_surface, (10, 10))
+        # Text only changes once per simulation hour, so only re-render when it does
+        if time_text != self.__time_text:
+            if self.__font is None:
+                pygame.font.init()
+                self.__font = pygame.font.SysFont('Arial Bold', 25)
+            self.__text_surface = self.__font.render(time_text, True, (0, 0, 0))
+            self.__time_text = time_text
+
+        return self.__display.get_screen().blit(self.__text_surface, (10, 10))
 
     def get_running(self) -> bool:
         """
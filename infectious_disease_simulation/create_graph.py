@@ -1,5 +1,5 @@
 """
-Defines CreateGraph class which creates a graph as an adjacency list from a 2D array.
+Defines CreateGraph class which creates a graph as an adjacency list from the building locations.
 
 Imports:
     numpy
@@ -9,21 +9,37 @@ Classes:
 """
 import numpy as np
 
+DISTANCE_BLOCK_ROWS: int = 256 # Buildings whose distances to every other building are calculated at once
+
 class CreateGraph:
     """
-    A class to create a graph as an adjacency list from a 2D array (the map).
+    A class to create a graph as an adjacency list from the building locations on the map.
 
     Attributes:
-        __map (np.ndarray): A 2D array representing the tilemap.
+        __points (np.ndarray): An (N, 2) array of the (x, y) tile location of each building.
     """
-    def __init__(self, map_array: np.ndarray) -> None:
+    def __init__(self, points: np.ndarray) -> None:
+        """
+        Initialises the CreateGraph class with the given building locations.
+
+        Args:
+            points (np.ndarray): An (N, 2) array of the (x, y) tile location of each building.
         """
-        Initialises the CreateGraph class with the given map.
+        self.__points: np.ndarray = np.asarray(points, dtype=np.int32).reshape(-1, 2)
+
+    @classmethod
+    def from_map_array(cls, map_array: np.ndarray) -> "CreateGraph":
+        """
+        Creates a CreateGraph from a 2D array (the map), using every non-zero tile as a building.
 
         Args:
-            map_array (np.ndarray): A 2D array representing the tilemap.
+            map_array (np.ndarray): A 2D array representing the tilemap, indexed [y, x].
+
+        Returns:
+            CreateGraph: A CreateGraph for the buildings on the map.
         """
-        self.__map: np.ndarray = map_array
+        rows, columns = np.nonzero(map_array)
+        return cls(np.stack([columns, rows], axis=1)) # [y, x] array indices to (x, y) locations
 
     def make_graph(self) -> dict[tuple[int, int], list[tuple[int, int]]]:
         """
@@ -34,42 +50,51 @@ class CreateGraph:
                  list[tuple[int, int]]]: Dictionary representing graph.
                                          Keys are nodes, and values are lists of neighbouring nodes.
         """
-        rows: int = len(self.__map)
-        columns: int = len(self.__map[0])
-        graph: dict[tuple[int, int], list[tuple[int, int]]] = {}
-        points: list[tuple[int, int]] = []
-        k: int = max(3, int(len(points) ** 0.5)) # Heuristic for number of neighbours
+        points_array: np.ndarray = self.__points
+        points: list[tuple[int, int]] = [tuple(point) for point in points_array.tolist()] # Plain int tuples as graph nodes
+
+        if len(points) < 2: # No neighbours to connect to
+            return {point: [] for point in points}
+
+        k: int = max(3, int(len(points) ** 0.5)) # Heuristic for number of neighbours (needs points collected first)
         k = min(k, 6) # Limit k to max 6
+        k = min(k, len(points) - 1) # May have fewer than K neighbours
+
+        # Floats so the distances below use fast matrix multiplication, they stay exact integers well below 2 ** 53
+        points_float: np.ndarray = points_array.astype(np.float64)
+        sum_sq: np.ndarray = (points_float * points_float).sum(1)
+        building_order: np.ndarray = np.arange(len(points), dtype=np.float64)
+        neighbours: np.ndarray = np.empty((len(points), k), dtype=np.intp)
+
+        # Work through the buildings a block of rows at a time, so memory grows with the number of buildings
+        # rather than its square
+        for start in range(0, len(points), DISTANCE_BLOCK_ROWS):
+            stop: int = min(start + DISTANCE_BLOCK_ROWS, len(points))
+            block: np.ndarray = points_float[start:stop]
+            rows: np.ndarray = np.arange(stop - start)
+
+            # Squared distance from each building in the block to every building (squared to avoid sqrt for efficiency),
+            # built in place to avoid block-sized temporaries
+            distances: np.ndarray = block @ points_float.T
+            distances *= -2
+            distances += sum_sq[start:stop, None]
+            distances += sum_sq
+
+            # Fold the building order into each distance so no two keys tie, and equally distant buildings are
+            # picked and ordered by building order, keeping neighbour lists deterministic
+            keys: np.ndarray = distances
+            keys *= len(points)
+            keys += building_order
+            keys[rows, rows + start] = np.inf # Do not connect building to itself
+
+            # Take the K nearest neighbours of each building without sorting the whole row, then order just those
+            idx: np.ndarray = np.argpartition(keys, k - 1, axis=1)[:, :k]
+            order: np.ndarray = np.argsort(np.take_along_axis(keys, idx, axis=1), axis=1)
+            neighbours[start:stop] = np.take_along_axis(idx, order, axis=1)
 
-        # Collect building tiles
-        for i in range(rows):
-            for j in range(columns):
-                if self.__map[i][j] != 0:
-                    points.append((i, j))
-
-        # For each building, find its nearest neighbours
-        for px, py in points:
-            distances: list[tuple[int, tuple[int, int]]] = []
-            # Compare current building to every other building
-            for qx, qy in points:
-                if (px, py) == (qx, qy): # Do not connect building to itself
-                    continue
-                
-                # Calculate distance (squared to avoid sqrt for efficiency)
-                dx = px - qx
-                dy = py - qy
-                distance_squared = dx * dx + dy * dy
-                distances.append((distance_squared, (qx, qy))) # Store distance and corresponding neighbour
-            
-            # Sort neighbours by distance
-            distances.sort(key=lambda item: item[0])
-
-            # Take the K nearest neighbours
-            neighbours: list[tuple[int, int]] = []
-            limit = min(k, len(distances)) # May have fewer than K neighbours
-            for i in range(limit):
-                neighbours.append(distances[i][1])
-            graph[(px, py)] = neighbours # Assign neighbour list to graph
+        graph: dict[tuple[int, int], list[tuple[int, int]]] = {
+            points[i]: [points[j] for j in neighbours[i]] for i in range(len(points))
+        } # Assign neighbour lists to graph
 
         return graph
 
@@ -61,7 +61,7 @@ class CreateMap:
         self.__tilemap.render(pause) # Draw tilemap
         print("Calculating Roads...")
         self.__roads = roads.Roads(self.__display, # Calculate roads
-                                   self.__tilemap.get_map(),
+                                   self.__tilemap.get_building_locations(),
                                    self.__building_width, self.__building_height,
                                    additional_roads)
         print("Drawing Roads...")
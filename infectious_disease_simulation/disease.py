@@ -2,28 +2,36 @@
 Defines the Disease class to model the spread, recovery, and mortality of an infectious disease.
 
 Imports:
-    random
+    math
+    numpy
 
 Classes:
     Disease
 """
 
-import random
+import math
+import numpy as np
+
+ROLL_BUFFER_SIZE: int = 4096 # Number of rolls drawn from the generator at a time
 
 class Disease:
     """
     A class to model the spread, recovery, and mortality of an infectious disease.
 
     Attributes:
-        __seconds_per_hour (float): The number of seconds per simulation hour.
         __infection_rate (float): The rate of infection per hour.
-        __incubation_time (float): The incubation time of the disease in real seconds.
+        __incubation_hours (int): The incubation time of the disease in whole simulation hours.
         __recovery_rate (float): The rate of recovery per hour.
         __mortality_rate (float): The rate of mortality per hour.
+        __infection_threshold (float): Precomputed threshold for an infection roll to succeed.
+        __recovery_threshold (float): Precomputed threshold for a recovery roll to succeed.
+        __mortality_threshold (float): Precomputed threshold for a death roll to succeed.
+        __rng (np.random.Generator): Random generator used for all rolls.
+        __roll_buffer (list[int]): Pre-drawn rolls between 0 and 1000 (inclusive).
+        __roll_index (int): Index of the next unused roll in the roll buffer.
     """
     def __init__(self, infection_rate: float, incubation_time: float,
-                 recovery_rate: float, mortality_rate: float,
-                 seconds_per_hour: float) -> None:
+                 recovery_rate: float, mortality_rate: float) -> None:
         """
         Initialises the Disease class with the given parameters.
 
@@ -32,14 +40,20 @@ class Disease:
             incubation_time (float): The incubation time in days.
             recovery_rate (float): The rate of recovery per day.
             mortality_rate (float): The rate of mortality per day.
-            seconds_per_hour (float): The number of seconds per simulation hour.
         """
-        self.__seconds_per_hour: float = seconds_per_hour
         self.__infection_rate: float = infection_rate / 24
-        self.__incubation_time: float = incubation_time * 24 * self.__seconds_per_hour
+        self.__incubation_hours: int = math.ceil(incubation_time * 24) # Infection status is updated once an hour
         self.__recovery_rate: float = recovery_rate / 24
         self.__mortality_rate: float = mortality_rate / 24
 
+        # Rates are fixed for the whole run, so scale them once rather than on every roll
+        self.__infection_threshold: float = self.__infection_rate * 1000
+        self.__recovery_threshold: float = self.__recovery_rate * 1000
+        self.__mortality_threshold: float = self.__mortality_rate * 1000
+        self.__rng: np.random.Generator = np.random.default_rng()
+        self.__roll_buffer: list[int] = []
+        self.__roll_index: int = 0
+
     def infect(self) -> bool:
         """
         Simulates whether an infection occurs based on the infection rate.
@@ -47,7 +61,26 @@ class Disease:
         Returns:
             bool: True if infection occurs, False otherwise.
         """
-        return random.randint(0, 1000) < self.__infection_rate * 1000
+        return self.__roll() < self.__infection_threshold
+
+    def infect_many(self, n: int) -> list[bool]:
+        """
+        Simulates whether an infection occurs for each of n contacts at once.
+        Takes all n rolls from the roll buffer in one slice.
+
+        Args:
+            n (int): The number of contacts to roll for.
+
+        Returns:
+            list[bool]: True where infection occurs, one per contact.
+        """
+        if self.__roll_index + n > len(self.__roll_buffer):
+            self.__refill_rolls(n)
+
+        rolls: list[int] = self.__roll_buffer[self.__roll_index:self.__roll_index + n]
+        self.__roll_index += n
+        threshold: float = self.__infection_threshold
+        return [roll < threshold for roll in rolls]
 
     def recover(self) -> bool:
         """
@@ -56,7 +89,7 @@ class Disease:
         Returns:
             bool: True if recovery occurs, False otherwise.
         """
-        return random.randint(0, 1000) < self.__recovery_rate * 1000
+        return self.__roll() < self.__recovery_threshold
 
     def die(self) -> bool:
         """
@@ -65,13 +98,37 @@ class Disease:
         Returns:
             bool: True if death occurs, False otherwise.
         """
-        return random.randint(0, 1000) < self.__mortality_rate * 1000
+        return self.__roll() < self.__mortality_threshold
+
+    def __roll(self) -> int:
+        """
+        Takes the next roll from the buffer, refilling it from the generator in one batch when used up.
+
+        Returns:
+            int: A random integer between 0 and 1000 (inclusive).
+        """
+        if self.__roll_index >= len(self.__roll_buffer):
+            self.__refill_rolls(1)
+
+        roll: int = self.__roll_buffer[self.__roll_index]
+        self.__roll_index += 1
+        return roll
+
+    def __refill_rolls(self, n: int) -> None:
+        """
+        Replaces the roll buffer with fresh rolls from the generator in one batch.
+
+        Args:
+            n (int): The number of rolls needed at once, the buffer holds at least this many.
+        """
+        self.__roll_buffer = self.__rng.integers(0, 1000, size=max(n, ROLL_BUFFER_SIZE), endpoint=True).tolist()
+        self.__roll_index = 0
 
-    def get_incubation_time(self) -> float:
+    def get_incubation_hours(self) -> int:
         """
-        Gets the incubation time of the disease.
+        Gets the incubation time of the disease in simulation hours.
 
         Returns:
-            float: The incubation time of the disease in seconds.
+            int: The number of hourly updates before an exposed person becomes infectious.
         """
-        return self.__incubation_time
+        return self.__incubation_hours
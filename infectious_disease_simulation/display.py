@@ -58,11 +58,17 @@ class Display:
         """
         self.__screen.fill(colour)
 
-    def update(self) -> None:
+    def update(self, rects: list[pygame.Rect] | None = None) -> None:
         """
         Updates the display screen.
+
+        Args:
+            rects (list[pygame.Rect] | None): The areas of the screen to update. Defaults to None (whole screen).
         """
-        pygame.display.update()
+        if rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
 
     def get_width(self) -> int:
         """
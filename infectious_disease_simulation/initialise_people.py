@@ -112,8 +112,7 @@ class InitialisePeople:
                                        home_location, office_location, home_position,
                                        home_radius, office_radius,
                                        home_to_office_route, speed, leave_home, status,
-                                       self.__disease, self.__disease.get_incubation_time(),
-                                       self.__seconds_per_hour)
+                                       self.__disease, self.__disease.get_incubation_hours())
 
             self.__tilemap.get_home_from_location(home_location).add_occupant(individual)
             self.__tilemap.get_office_from_location(office_location).add_occupant(individual)
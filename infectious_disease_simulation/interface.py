@@ -5,8 +5,9 @@ Imports:
     tkinter
     ttk
     messagebox
-    sqlite3
     math
+    itertools
+    sql_handler: Handles SQL database interactions.
 
 Classes:
     Interface
@@ -14,8 +15,31 @@ Classes:
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import sqlite3
 import math
+import itertools
+from . import sql_handler
+
+# Entry fields and the type each must convert to, in the order they are checked
+ENTRY_FIELDS: tuple[tuple[str, type], ...] = (
+    ("simulation_name", str),
+    ("display_size", int),
+    ("num_houses", int),
+    ("num_offices", int),
+    ("building_size", int),
+    ("num_people_in_house", int),
+    ("infection_rate", float),
+    ("incubation_time", float),
+    ("recovery_rate", float),
+    ("mortality_rate", float),
+)
+
+# Disease fields with their allowed (inclusive) range and the message shown if out of range
+DISEASE_BOUNDS: tuple[tuple[str, float, float, str], ...] = (
+    ("infection_rate", 0, 1, "Infection rate must be a decimal between 0 and 1."),
+    ("incubation_time", 0, math.inf, "Incubation time cannot be less than 0 days."),
+    ("recovery_rate", 0, 1, "Recovery rate must be a decimal between 0 and 1."),
+    ("mortality_rate", 0, 1, "Mortality rate must be a decimal between 0 and 1."),
+)
 
 class Interface:
     """
@@ -200,19 +224,17 @@ class Interface:
         """
         try:
             # Fetch and validate parameters
-            simulation_name: str = self.__is_type(str, self.__params["simulation_name"].get())
-            display_size: int = self.__is_type(int, self.__params["display_size"].get())
-            num_houses: int = self.__is_type(int, self.__params["num_houses"].get())
-            num_offices: int = self.__is_type(int, self.__params["num_offices"].get())
-            building_size: int = self.__is_type(int, self.__params["building_size"].get())
-            num_people_in_house: int = self.__is_type(int, self.__params["num_people_in_house"].get())
+            values: dict[str, any] = {key: self.__is_type(variable_type, self.__params[key].get())
+                                      for key, variable_type in ENTRY_FIELDS}
+            simulation_name: str = values["simulation_name"]
+            display_size: int = values["display_size"]
+            num_houses: int = values["num_houses"]
+            num_offices: int = values["num_offices"]
+            building_size: int = values["building_size"]
+            num_people_in_house: int = values["num_people_in_house"]
             simulation_speed: float = self.__is_type(float, self.__simulation_speed.get())
             show_drawing: bool = self.__show_drawing.get()
             additional_roads: bool = self.__additional_roads.get()
-            infection_rate: float = self.__is_type(float, self.__params["infection_rate"].get())
-            incubation_time: float = self.__is_type(float, self.__params["incubation_time"].get())
-            recovery_rate: float = self.__is_type(float, self.__params["recovery_rate"].get())
-            mortality_rate: float = self.__is_type(float, self.__params["mortality_rate"].get())
 
             # Validate parameters
             if len(simulation_name) == 0:
@@ -236,14 +258,9 @@ class Interface:
             (building_size // (2 * (math.ceil(math.sqrt(num_people_in_house)) + 1)) < 1) or
             (building_size // (2 * (math.ceil(math.sqrt((num_people_in_house * num_houses) // num_offices)) + 1)) < 1)):
                 raise ValueError("Population size too large and/or Building size too small for people to be seen.")
-            if infection_rate > 1 or infection_rate < 0:
-                raise ValueError(f"'{infection_rate}'. Infection rate must be a decimal between 0 and 1.")
-            if incubation_time < 0:
-                raise ValueError(f"'{incubation_time}'. Incubation time cannot be less than 0 days.")
-            if recovery_rate > 1 or recovery_rate < 0:
-                raise ValueError(f"'{recovery_rate}'. Recovery rate must be a decimal between 0 and 1.")
-            if mortality_rate > 1 or mortality_rate < 0:
-                raise ValueError(f"'{mortality_rate}'. Mortality rate must be a decimal between 0 and 1.")
+            for key, lower, upper, message in DISEASE_BOUNDS:
+                if not lower <= values[key] <= upper:
+                    raise ValueError(f"'{values[key]}'. {message}")
 
             # Warning for large population
             if num_people_in_house * num_houses >= 1000:
@@ -273,7 +290,7 @@ class Interface:
                     return
 
             # Warning for simulation running forever
-            if recovery_rate == 0 and mortality_rate == 0:
+            if values["recovery_rate"] == 0 and values["mortality_rate"] == 0:
                 proceed_no_sim_end: bool = messagebox.askokcancel(
                     "Warning",
                     "Both the recovery rate and mortality rate are 0, so the simulation will not end.\n"
@@ -286,19 +303,10 @@ class Interface:
 
             # Set validated parameters
             self.__params = {
-                "simulation_name": simulation_name,
+                **values,
                 "simulation_speed": simulation_speed,
-                "display_size": display_size,
-                "num_houses": num_houses,
-                "num_offices": num_offices,
-                "building_size": building_size,
-                "num_people_in_house": num_people_in_house,
                 "show_drawing": show_drawing,
-                "additional_roads": additional_roads,
-                "infection_rate": infection_rate,
-                "incubation_time": incubation_time,
-                "recovery_rate": recovery_rate,
-                "mortality_rate": mortality_rate
+                "additional_roads": additional_roads
             }
             self.__root.quit()
             self.__root.destroy()
@@ -363,35 +371,11 @@ class Interface:
         Args:
             db_name (str): The name of the database file.
         """
-        connection = sqlite3.connect(db_name)
-        cursor = connection.cursor()
-
-        # Exception handling for loading data
-        try:
-            cursor.execute("""
-                        SELECT
-                           run_id,
-                           datetime,
-                           simulation_name,
-                           num_houses,
-                           num_offices,
-                           infection_rate,
-                           incubation_time,
-                           recovery_rate,
-                           mortality_rate
-                        FROM
-                           simulations
-                        ORDER BY
-                           run_id DESC""")
-        except sqlite3.OperationalError:
-            messagebox.showinfo("Load Previous Run", "No previous runs found.")
-            return
-
-        rows = cursor.fetchall()
-        connection.close()
+        rows = sql_handler.SQLHandler(db_name).fetch_runs_summary()
+        first_row = next(rows, None) # Rows are streamed, so check for the first one
 
         # If empty database of previous runs
-        if not rows:
+        if first_row is None:
             messagebox.showinfo("Load Previous Run", "No previous runs found.")
             return
 
@@ -434,8 +418,8 @@ class Interface:
         tree.configure(yscroll=scrollbar.set)
         scrollbar.grid(row=0, column=1, sticky="ns")
 
-        for row in rows:
-            tree.insert("", "end", values=row)
+        for row in itertools.chain((first_row,), rows):
+            tree.insert("", "end", values=[row[col] for col in tree["columns"]])
 
         # Load button calls for loading selected run
         ttk.Button(selection_window, text="Load",
@@ -473,45 +457,17 @@ class Interface:
             selection_window (tk.Toplevel): The window for selecting the previous run.
             db_name (str): The name of the database file.
         """
-        connection = sqlite3.connect(db_name)
-        cursor = connection.cursor()
-        cursor.execute("SELECT * FROM simulations WHERE run_id=?", (run_id,))
-        row = cursor.fetchone()
-        connection.close()
+        row = sql_handler.SQLHandler(db_name).fetch_run(run_id)
 
         # Delete previous values and insert loaded values
         if row:
-            (_, _, # run_id, datetime
-             simulation_name, simulation_speed,
-             display_size,
-             num_houses, num_offices, building_size,
-             num_people_in_house,
-             show_drawing, additional_roads,
-             infection_rate, incubation_time, recovery_rate, mortality_rate) = row
-            self.__params["simulation_name"].delete(0, tk.END)
-            self.__params["simulation_name"].insert(0, simulation_name)
-            self.__params["display_size"].delete(0, tk.END)
-            self.__params["display_size"].insert(0, display_size)
-            self.__params["num_houses"].delete(0, tk.END)
-            self.__params["num_houses"].insert(0, num_houses)
-            self.__params["num_offices"].delete(0, tk.END)
-            self.__params["num_offices"].insert(0, num_offices)
-            self.__params["building_size"].delete(0, tk.END)
-            self.__params["building_size"].insert(0, building_size)
-            self.__params["num_people_in_house"].delete(0, tk.END)
-            self.__params["num_people_in_house"].insert(0, num_people_in_house)
-            self.__simulation_speed.set(simulation_speed)
-            self.__update_speed_label(simulation_speed)
-            self.__show_drawing.set(show_drawing)
-            self.__additional_roads.set(additional_roads)
-            self.__params["infection_rate"].delete(0, tk.END)
-            self.__params["infection_rate"].insert(0, infection_rate)
-            self.__params["incubation_time"].delete(0, tk.END)
-            self.__params["incubation_time"].insert(0, incubation_time)
-            self.__params["recovery_rate"].delete(0, tk.END)
-            self.__params["recovery_rate"].insert(0, recovery_rate)
-            self.__params["mortality_rate"].delete(0, tk.END)
-            self.__params["mortality_rate"].insert(0, mortality_rate)
+            for name, _ in ENTRY_FIELDS: # Entry columns share the entry field names
+                self.__params[name].delete(0, tk.END)
+                self.__params[name].insert(0, row[name])
+            self.__simulation_speed.set(row["simulation_speed"])
+            self.__update_speed_label(row["simulation_speed"])
+            self.__show_drawing.set(row["show_drawing"])
+            self.__additional_roads.set(row["additional_roads"])
 
         selection_window.destroy() # Close selection window
 
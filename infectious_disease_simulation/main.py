@@ -3,6 +3,7 @@ Main module to initialise and run the simulation.
 
 Imports:
     pygame
+    operator
     interface: Manages the simulation parameters interface.
     sql_handler: Handles SQL database interactions.
     display: Manages display settings and updates.
@@ -17,6 +18,7 @@ Classes:
 
 import pygame
 import os
+import operator
 from . import interface
 from . import sql_handler
 from . import display
@@ -25,6 +27,18 @@ from . import disease
 from . import population
 from . import clock
 
+# Parameters saved to the database, in the column order of the simulations table
+SAVED_PARAMS: operator.itemgetter = operator.itemgetter("simulation_name", "simulation_speed",
+                                                        "display_size",
+                                                        "num_houses", "num_offices", "building_size",
+                                                        "num_people_in_house",
+                                                        "show_drawing", "additional_roads",
+                                                        "infection_rate", "incubation_time",
+                                                        "recovery_rate", "mortality_rate")
+
+# Events telling the window it has been uncovered or restored and needs repainting
+EXPOSE_EVENTS: tuple[int, ...] = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
 class Main:
     """
     Main class to initialise and run the simulation.
@@ -88,8 +102,7 @@ class Main:
         self.__disease: disease.Disease = disease.Disease(self.__params['infection_rate'],
                                                           self.__params['incubation_time'],
                                                           self.__params['recovery_rate'],
-                                                          self.__params['mortality_rate'],
-                                                          self.__seconds_per_hour)
+                                                          self.__params['mortality_rate'])
 
         # Initialise population with parameters
         print("Initialising Population...")
@@ -123,24 +136,19 @@ class Main:
         Saves the parameters to the database using SQLHandler.
         """
         # Get parameters and save in database
-        params: tuple = (
-            self.__params["simulation_name"], self.__params["simulation_speed"],
-            self.__params["display_size"],
-            self.__params["num_houses"], self.__params["num_offices"], self.__params["building_size"],
-            self.__params["num_people_in_house"],
-            self.__params["show_drawing"], self.__params["additional_roads"],
-            self.__params["infection_rate"], self.__params["incubation_time"],
-            self.__params["recovery_rate"], self.__params["mortality_rate"]
-        )
+        params: tuple = SAVED_PARAMS(self.__params)
         self.__sql_handler.save_params(params)
 
     def __initialise_display(self) -> None:
         """
         Initialises the display by setting the caption, filling the background, and setting the display icon.
+        Only quit and window expose events are queued, as no other events are handled.
         """
         self.__display.set_caption()
         self.__display.fill((255, 255, 255))
         self.__display.set_display_icon("infectious_disease_simulation/images/virus_icon.png")
+        pygame.event.set_blocked(None) # Block all events from the queue...
+        pygame.event.set_allowed([pygame.QUIT, *EXPOSE_EVENTS]) # ...except quitting and exposing the window
 
     def __run_simulation(self) -> None:
         """
@@ -148,21 +156,35 @@ class Main:
         """
         running: bool = True # Flag for running
         pygame_clock: pygame.time.Clock = pygame.time.Clock()
+        dirty_rects: list[pygame.Rect] = [] # Areas drawn over in the last frame
 
         # Enter simulation loop
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT: # Handle quitting
-                    running = False
+            # Let pygame process window events, checking for expose events without building a list of them
+            exposed: bool = pygame.event.peek(EXPOSE_EVENTS)
+            if exposed:
+                pygame.event.clear(EXPOSE_EVENTS) # Drain them so the queue cannot fill up
+            if pygame.event.peek(pygame.QUIT): # Handle quitting
+                running = False
 
             if self.__clock.get_running():
                 self.__clock.update_time() # Update simulation time
                 self.__population.update_positions() # Update people's positions
-                self.__display.get_screen().blit(self.__map_surface, (0, 0)) # Map surface as 'background'
-                self.__population.draw_people() # Draw people
-            
-            self.__clock.display_time() # Draw the clock on top
-            self.__display.update()
+
+            # Map surface as 'background', restored only where people and the clock were last drawn,
+            # or everywhere if the window has been uncovered and its contents may have been lost
+            if exposed:
+                self.__display.get_screen().blit(self.__map_surface, (0, 0))
+            else:
+                for rect in dirty_rects:
+                    self.__display.get_screen().blit(self.__map_surface, rect, rect)
+            drawn_rects: list[pygame.Rect] = self.__population.draw_people() # Draw people
+            drawn_rects.append(self.__clock.display_time()) # Draw the clock on top
+            if exposed:
+                self.__display.update() # Update the whole window
+            else:
+                self.__display.update(dirty_rects + drawn_rects) # Update old and new areas only
+            dirty_rects = drawn_rects
             pygame_clock.tick(self.__fps) # Update required parts every frame
         pygame.quit()
 
@@ -4,7 +4,7 @@ Defines MST class which creates the MST from a graph.
 Imports:
     math
     numpy
-    create_graph: Creates a graph as an adjacency list from the map array.
+    create_graph: Creates a graph as an adjacency list from the building locations.
     additional_connections: Adds additional roads to network.
 
 Classes:
@@ -26,16 +26,16 @@ class MST:
         __parent (dict[tuple[int, int], tuple[int, int]])): Dictionary of each node's parent.
         __rank (dict[tuple[int, int], int]): Dictionary to keep track of the rank of each node.
     """
-    def __init__(self, map_array: np.ndarray) -> None:
+    def __init__(self, building_locations: np.ndarray) -> None:
         """
-        Intialises the MST class with the given map.
+        Intialises the MST class with the given building locations.
 
         Args:
-            map_array (np.ndarray): A 2D array representing the tilemap.
+            building_locations (np.ndarray): An (N, 2) array of the (x, y) tile location of each building.
         """
-        # Create the graph from the map
-        self.__graph: dict[tuple[int, int], # Create the graph from the map
-                           list[tuple[int, int]]] = self.__swap_coordinates(create_graph.CreateGraph(map_array).make_graph())
+        # Create the graph from the building locations
+        self.__graph: dict[tuple[int, int],
+                           list[tuple[int, int]]] = create_graph.CreateGraph(building_locations).make_graph()
         # Create a list of edges with weights
         self.__edges: list[tuple[int, tuple[int, int],
                                  tuple[int, int]]] = self.__create_edge_list()
@@ -44,31 +44,6 @@ class MST:
         # Initialise the rank dictionary for union-find
         self.__rank: dict[tuple[int, int], int] = {}
 
-    def __swap_coordinates(self, graph: dict[tuple[int, int],
-                                             list[tuple[int, int]]]) -> dict[tuple[int, int],
-                                                                             list[tuple[int, int]]]:
-        """
-        Swap the coordinates of every node and neighbour in the given graph.
-
-        NOTE: Swapped x, y coordinates due to differences in pygame coordinate system.
-
-        Args:
-            graph (dict[tuple[int, int], list[tuple[int, int]]]): The input graph to swap coordinates.
-
-        Returns:
-            dict[tuple[int, int], list[tuple[int, int]]]: Graph with swapped coordinates for nodes and neighbours.
-        """
-        swapped_graph: dict[tuple[int, int], list[tuple[int, int]]] = {}
-
-        for node, neighbours in graph.items():
-            swapped_node: tuple[int, int] = (node[1], node[0]) # Swap coordinates
-            swapped_neighbours: list[tuple[int, int]] = []
-            for neighbour in neighbours:
-                swapped_neighbours.append((neighbour[1], neighbour[0])) # Add swapped coordinates to list
-            swapped_graph[swapped_node] = swapped_neighbours
-
-        return swapped_graph
-
     def __create_edge_list(self) -> list[tuple[int, tuple[int, int], tuple[int, int]]]:
         """
         Convert the adjacency list to a list of edges with weights.
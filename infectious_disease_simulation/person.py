@@ -39,8 +39,7 @@ class Person:
         __route_index (int): The index of the current position in the route.
         __moving (bool): Whether the person is moving.
         __disease (disease.Disease): The disease object managing infection.
-        __incubation_time (float): The incubation time remaining for the person before becoming infectious.
-        __seconds_per_hour (float): The number of seconds per simulation hour.
+        __incubation_hours (int): The number of simulation hours remaining before the person becomes infectious.
     """
     def __init__(self, display_obj: display.Display,
                  person_id: int,
@@ -48,8 +47,7 @@ class Person:
                  home_radius: int, office_radius: int,
                  home_to_office_route: list[tuple[int, int]],
                  speed: float, leave_home: int, status: str,
-                 disease_obj: disease.Disease, incubation_time: float,
-                 seconds_per_hour: float) -> None:
+                 disease_obj: disease.Disease, incubation_hours: int) -> None:
         """
         Initialises the Person class with the given parameters.
 
@@ -66,8 +64,7 @@ class Person:
             leave_home (int): The time to leave home.
             status (str): The infection status of the person.
             disease_obj (disease.Disease): The disease object managing infection.
-            incubation_time (float): The incubation time for the disease.
-            seconds_per_hour (float): The number of seconds per simulation hour.
+            incubation_hours (int): The incubation time for the disease in simulation hours.
         """
         self.__display: display.Display = display_obj
         self.__person_id: int = person_id
@@ -88,17 +85,19 @@ class Person:
         self.__route_index: int = 0
         self.__moving: bool = False
         self.__disease: disease.Disease = disease_obj
-        self.__incubation_time: float = incubation_time
-        self.__seconds_per_hour: float = seconds_per_hour
+        self.__incubation_hours: int = incubation_hours
 
-    def draw_person(self) -> None:
+    def draw_person(self) -> pygame.Rect:
         """
         Draws the person as a circle on the display surface.
+
+        Returns:
+            pygame.Rect: The area of the display surface drawn on.
         """
-        pygame.draw.circle(self.__display.get_screen(),
-                           self.get_colour(),
-                           (int(self.__current_position[0]), int(self.__current_position[1])),
-                           self.get_radius())
+        return pygame.draw.circle(self.__display.get_screen(),
+                                  self.get_colour(),
+                                  (int(self.__current_position[0]), int(self.__current_position[1])),
+                                  self.get_radius())
 
     def get_leave_home(self) -> int:
         """
@@ -275,8 +274,8 @@ class Person:
         the disease recovery and mortality rates.
         """
         if self.__status == "E":
-            self.__incubation_time -= self.__seconds_per_hour  # Decrease incubation time
-            if self.__incubation_time <= 0: # Set to infected once incubation time left reaches 0
+            self.__incubation_hours -= 1  # Decrease incubation time (called once per simulation hour)
+            if self.__incubation_hours <= 0: # Set to infected once incubation time left reaches 0
                 self.__status = "I"
         elif self.__status == "I":
             if self.__disease.recover(): # Probability of recovering
@@ -3,6 +3,7 @@ Defines the Population class to manage the collection of people in the simulatio
 
 Imports:
     math
+    pygame
     initialise_people: Class which handles the initialisation of each person.
     display: Manages display settings and updates.
     create_map: Creates and manages the simulation map.
@@ -14,6 +15,7 @@ Classes:
     Population
 """
 import math
+import pygame
 from . import initialise_people
 from . import display # For typing
 from . import create_map # For typing
@@ -67,12 +69,14 @@ class Population:
                                                                                                self.__fps).get_people()
         self.__route_intersections: dict[int, list[person.Person]] = self.__find_route_intersections()
 
-    def draw_people(self) -> None:
+    def draw_people(self) -> list[pygame.Rect]:
         """
         Draws all people in the simulation on the display.
+
+        Returns:
+            list[pygame.Rect]: The areas of the display drawn on.
         """
-        for individual in self.__people:
-            individual.draw_person()
+        return [individual.draw_person() for individual in self.__people]
 
     def get_people(self) -> list[person.Person]:
         """
@@ -169,12 +173,12 @@ class Population:
         """
         # Check people with intersections, calculate if touching and subject person to probability of getting infected
         if individual.get_status() == "I":
-            for other in self.__route_intersections[individual.get_person_id()]:
-                if (other.get_status() == "S" and
-                    self.__calculate_distance(individual.get_current_position(),
-                                              other.get_current_position()) <= 2 * individual.get_radius()):
-                    if self.__disease.infect():
-                        other.set_status("E")
+            contacts: list[person.Person] = [other for other in self.__route_intersections[individual.get_person_id()]
+                                             if (other.get_status() == "S" and
+                                                 self.__calculate_distance(individual.get_current_position(),
+                                                                           other.get_current_position())
+                                                 <= 2 * individual.get_radius())]
+            self.__expose(contacts)
 
     def __check_building_interactions(self) -> None:
         """
@@ -191,9 +195,21 @@ class Population:
                     occupants = self.__tilemap.get_office_from_location(individual.get_office_location()).get_occupants()
 
                 # Chance of those in same building getting infected
-                for occupant in occupants:
-                    if occupant.get_status() == "S" and self.__disease.infect():
-                        occupant.set_status("E")
+                self.__expose([occupant for occupant in occupants if occupant.get_status() == "S"])
+
+    def __expose(self, contacts: list[person.Person]) -> None:
+        """
+        Rolls for infection for all susceptible contacts at once, exposing those who are infected.
+
+        Args:
+            contacts (list[person.Person]): The susceptible people in contact with an infected individual.
+        """
+        if not contacts:
+            return
+
+        for contact, infected in zip(contacts, self.__disease.infect_many(len(contacts))):
+            if infected:
+                contact.set_status("E")
 
     def __calculate_distance(self, pos1: tuple[int, int], pos2: tuple[int, int]) -> float:
         """
@@ -21,7 +21,7 @@ class Roads:
 
     Attributes:
         __display (display.Display): The display surface on which the roads will be drawn.
-        __map (np.ndarray): A 2D array representing the tilemap.
+        __building_locations (np.ndarray): An (N, 2) array of the (x, y) tile location of each building.
         __building_width (int): The width of each building in the tilemap.
         __building_height (int): The height of each building in the tilemap.
         __additional_roads (bool): True if additional roads to be included, False if not.
@@ -29,7 +29,7 @@ class Roads:
     """
     def __init__(self,
                  display_obj: display.Display,
-                 map_array: np.ndarray,
+                 building_locations: np.ndarray,
                  building_width: int, building_height: int,
                  additional_roads: bool) -> None:
         """
@@ -37,18 +37,18 @@ class Roads:
 
         Args:
             display_obj (display.Display): The display surface on which the roads will be drawn.
-            map_array (np.ndarray): A 2D array representing the tilemap.
+            building_locations (np.ndarray): An (N, 2) array of the (x, y) tile location of each building.
             building_width (int): The width of each building in the tilemap.
             building_height (int): The height of each building in the tilemap.
             additional_roads (bool): True if additional roads to be included.
         """
         self.__display: display.Display = display_obj
-        self.__map: np.ndarray = map_array
+        self.__building_locations: np.ndarray = building_locations
         self.__building_width: int = building_width
         self.__building_height: int = building_height
         self.__additional_roads: bool = additional_roads
         self.__mst_dict: dict[tuple[int, int],
-                              list[tuple[tuple[int, int], int]]] = mst.MST(self.__map).get_mst(self.__additional_roads)
+                              list[tuple[tuple[int, int], int]]] = mst.MST(self.__building_locations).get_mst(self.__additional_roads)
 
     def get_roads(self) -> dict[tuple[int, int], list[tuple[tuple[int, int], int]]]:
         """
@@ -3,34 +3,112 @@ Defines the SQLHandler class to manage database interactions.
 
 Imports:
     sqlite3
-    datetime
+    itertools
+    collections.abc
+    threading
+    atexit
 
 Classes:
     SQLHandler
 """
 import sqlite3
-import datetime
+import itertools
+from collections.abc import Iterator
+import threading
+import atexit
+
+CREATE_TABLE_QUERY: str = """
+CREATE TABLE IF NOT EXISTS simulations (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    datetime TEXT NOT NULL,
+    simulation_name TEXT NOT NULL,
+    simulation_speed REAL NOT NULL,
+    display_size INTEGER NOT NULL,
+    num_houses INTEGER NOT NULL,
+    num_offices INTEGER NOT NULL,
+    building_size INTEGER NOT NULL,
+    num_people_in_house INTEGER NOT NULL,
+    show_drawing INTEGER NOT NULL,
+    additional_roads INTEGER NOT NULL,
+    infection_rate REAL NOT NULL,
+    incubation_time REAL NOT NULL,
+    recovery_rate REAL NOT NULL,
+    mortality_rate REAL NOT NULL
+);
+"""
+SAVE_QUERY: str = """
+INSERT INTO simulations (datetime, simulation_name, simulation_speed, display_size, num_houses, num_offices, 
+building_size, num_people_in_house, show_drawing, additional_roads, infection_rate, 
+incubation_time, recovery_rate, mortality_rate) 
+VALUES (datetime('now', 'localtime'), ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+RUNS_SUMMARY_QUERY: str = """
+SELECT run_id, datetime, simulation_name, num_houses, num_offices,
+infection_rate, incubation_time, recovery_rate, mortality_rate
+FROM simulations
+ORDER BY run_id DESC
+"""
+RUN_QUERY: str = "SELECT * FROM simulations WHERE run_id=?"
+STATEMENT_CACHE_SIZE: int = 256 # Prepared statements kept by each connection, reused as queries are constants
+SAVE_BATCH_SIZE: int = 50 # Rows inserted per transaction when saving many runs
+FETCH_BATCH_SIZE: int = 256 # Rows read from the database at a time when streaming runs
+CONNECTION_PRAGMAS: tuple[str, ...] = (
+    "journal_mode=WAL", # Commits append to a write-ahead log instead of rewriting the database file
+    "synchronous=NORMAL", # Safe with WAL, and avoids an fsync on every commit
+    "temp_store=MEMORY",
+    "cache_size=-64000", # 64 MB page cache
+    "mmap_size=268435456", # Read pages through a 256 MB memory map
+)
 
 class SQLHandler:
     """
-    A class to handle SQLite database interactions for saving simulation parameters.
+    A class to handle SQLite database interactions for saving and loading simulation parameters.
+    Handlers for the same database file share one connection, which stays open until the program exits
+    and may be used from any thread.
 
     Attributes:
+        __connections (dict[str, sqlite3.Connection]): Open connections shared by all handlers, by database name.
+        __lock (threading.Lock): Lock held while opening a shared connection or reading or writing through one.
         __connection (sqlite3.Connection): The SQLite database connection.
+        __cursor (sqlite3.Cursor): The handler's cursor, reused by every query.
     """
+    __connections: dict[str, sqlite3.Connection] = {}
+    __lock: threading.Lock = threading.Lock()
+
     def __init__(self, db_name: str = 'simulation_params.db') -> None:
         """
-        Initialises the SQLHandler class by creating a database connection and table.
+        Initialises the SQLHandler class with the shared database connection, creating it and the table if needed.
 
         Args:
             db_name (str): The name of the database file. Defaults to 'simulation_params.db'.
         """
-        self.__connection: sqlite3.Connection = self.__create_connection(db_name)
-        self.__create_table()
+        self.__connection: sqlite3.Connection = self.__get_connection(db_name)
+        self.__cursor: sqlite3.Cursor = self.__connection.cursor() # One cursor rather than one per query
+
+    def __get_connection(self, db_name: str) -> sqlite3.Connection:
+        """
+        Gets the shared connection to the database, creating it and the table on first use.
+
+        Args:
+            db_name (str): The name of the database file.
+
+        Returns:
+            sqlite3.Connection: The database connection.
+        """
+        with SQLHandler.__lock:
+            connection: sqlite3.Connection = SQLHandler.__connections.get(db_name)
+            if connection is None:
+                connection = self.__create_connection(db_name)
+                if connection is not None:
+                    self.__create_table(connection)
+                    SQLHandler.__connections[db_name] = connection
+                    atexit.register(connection.close) # Closed once, when the program exits
+        return connection
 
     def __create_connection(self, db_name: str) -> sqlite3.Connection:
         """
-        Creates a connection to the SQLite database.
+        Creates a connection to the SQLite database and applies CONNECTION_PRAGMAS.
+        The connection is in autocommit mode, so transactions are begun and committed explicitly.
 
         Args:
             db_name (str): The name of the database file.
@@ -42,40 +120,29 @@ class SQLHandler:
 
         # Error handling
         try:
-            connection = sqlite3.connect(db_name)
+            # Shared by handlers on any thread, with reads and writes serialised by the class lock
+            connection = sqlite3.connect(db_name, timeout=30, isolation_level=None,
+                                         cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False)
+            connection.row_factory = sqlite3.Row # Rows readable by column name
+            cursor = connection.cursor()
+            for pragma in CONNECTION_PRAGMAS:
+                cursor.execute(f"PRAGMA {pragma}")
         except sqlite3.Error as error:
             print(f"The error '{error}' occurred")
         return connection
 
-    def __create_table(self) -> None:
+    def __create_table(self, connection: sqlite3.Connection) -> None:
         """
         Creates the 'simulations' table in the database if it does not already exist.
-        """
-        create_table_query = """
-        CREATE TABLE IF NOT EXISTS simulations (
-            run_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            datetime TEXT NOT NULL,
-            simulation_name TEXT NOT NULL,
-            simulation_speed REAL NOT NULL,
-            display_size INTEGER NOT NULL,
-            num_houses INTEGER NOT NULL,
-            num_offices INTEGER NOT NULL,
-            building_size INTEGER NOT NULL,
-            num_people_in_house INTEGER NOT NULL,
-            show_drawing INTEGER NOT NULL,
-            additional_roads INTEGER NOT NULL,
-            infection_rate REAL NOT NULL,
-            incubation_time REAL NOT NULL,
-            recovery_rate REAL NOT NULL,
-            mortality_rate REAL NOT NULL
-        );
+
+        Args:
+            connection (sqlite3.Connection): The database connection.
         """
 
         # Error handling
         try:
-            cursor = self.__connection.cursor()
-            cursor.execute(create_table_query)
-            self.__connection.commit()
+            cursor = connection.cursor()
+            cursor.execute(CREATE_TABLE_QUERY)
         except sqlite3.Error as error:
             print(f"The error '{error}' occurred")
 
@@ -86,23 +153,68 @@ class SQLHandler:
         Args:
             params (tuple): The simulation parameters to save.
         """
-        datetime_str: str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") # Current datetime
-        parameters = (datetime_str, *params) # Required parameters, unpacks params
+        self.bulk_save_params([params])
 
-        save_query = """
-        INSERT INTO simulations (datetime, simulation_name, simulation_speed, display_size, num_houses, num_offices, 
-        building_size, num_people_in_house, show_drawing, additional_roads, infection_rate, 
-        incubation_time, recovery_rate, mortality_rate) 
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    def bulk_save_params(self, params_list: list[tuple]) -> None:
+        """
+        Saves the parameters of many simulations to the database.
+        Rows are inserted in batches, committing once per batch rather than once per row.
+
+        Args:
+            params_list (list[tuple]): The simulation parameters to save, one tuple per simulation.
+        """
+        rows = iter(params_list) # Datetime is filled in by SQLite when each row is inserted
+
+        cursor = self.__cursor
+        with SQLHandler.__lock:
+            while batch := list(itertools.islice(rows, SAVE_BATCH_SIZE)):
+                cursor.execute("BEGIN")
+                try:
+                    cursor.executemany(SAVE_QUERY, batch)
+                except sqlite3.Error:
+                    cursor.execute("ROLLBACK") # Do not leave a partial batch open
+                    raise
+                cursor.execute("COMMIT")
+
+    def fetch_runs_summary(self) -> Iterator[dict[str, any]]:
         """
+        Fetches the most important parameters of every previous run, most recent first.
+        Rows are streamed FETCH_BATCH_SIZE at a time rather than all held in memory at once.
+        Uses its own cursor, so other queries on the handler do not cut the stream short.
 
+        Yields:
+            dict[str, any]: A row of run_id, datetime, simulation_name, num_houses, num_offices,
+                            infection_rate, incubation_time, recovery_rate, mortality_rate by column name.
+        """
         cursor = self.__connection.cursor()
-        cursor.execute(save_query, parameters)
-        self.__connection.commit()
+        # Lock held per batch, not across yields, so reads never land inside another thread's open transaction
+        with SQLHandler.__lock:
+            rows: list[sqlite3.Row] = cursor.execute(RUNS_SUMMARY_QUERY).fetchmany(FETCH_BATCH_SIZE)
+        while rows:
+            for row in rows:
+                yield dict(row)
+            with SQLHandler.__lock:
+                rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+        cursor.close()
+
+    def fetch_run(self, run_id: int) -> dict[str, any] | None:
+        """
+        Fetches all the parameters of a previous run.
+
+        Args:
+            run_id (int): The ID of the run.
+
+        Returns:
+            dict[str, any] | None: The run's row in the simulations table by column name, or None if there is no such run.
+        """
+        with SQLHandler.__lock:
+            row: sqlite3.Row | None = self.__cursor.execute(RUN_QUERY, (run_id,)).fetchone()
+        return dict(row) if row else None
 
     def close_connection(self) -> None:
         """
-        Closes the database connection.
+        Closes the handler's cursor and releases its connection.
+        The shared connection itself stays open for other handlers and is closed when the program exits.
         """
-        if self.__connection:
-            self.__connection.close()
+        self.__cursor.close()
+        self.__connection = None
@@ -2,7 +2,6 @@
 Defines Tilemap class which creates a random tilemap with buildings.
 
 Imports:
-    random
     numpy
     pygame
     buildings: Types of buildings and their properties.
@@ -11,12 +10,13 @@ Imports:
 Classes:
     Tilemap
 """
-import random
 import numpy as np
 import pygame
 from . import buildings
 from . import display # For typing
 
+PAUSE_BATCH: int = 16 # Buildings drawn between display updates when the drawing process is shown
+
 class Tilemap:
     """
     A class to create a tilemap on which different types of buildings can be placed and displayed.
@@ -25,17 +25,22 @@ class Tilemap:
         __display (display.Display): Display surface on which the tilemap will be rendered.
         __building_width (int): The width of the building to be displayed in the tilemap.
         __building_height (int): The height of the building to be displayed in the tilemap.
-        __size (tuple[int, int]): Number of tiles, depending on display size and building size.
-        __map (np.ndarray): A 2D array representing the tilemap grid, initialised with 0s.
+        __size (tuple[int, int]): Number of tiles (across, down), depending on display size and building size.
+        __map (np.ndarray): A 2D (rows, columns) array representing the tilemap grid indexed [y, x], initialised with 0s.
         __houses_list (list[buildings.House]): List of House objects in the tilemap.
         __offices_list (list[buildings.Office]): List of Office objects in the tilemap
-        __houses_dict (dict[tuple[int, int], buildings.House]): Dictionary mapping locations to House objects in the tilemap.
-        __offices_dict (dict[tuple[int, int], buildings.Office]): Dictionary mapping locations to Office objects in the tilemap.
+        __houses_dict (dict[int, buildings.House]): Dictionary mapping location keys (y * width + x) to House objects in the tilemap.
+        __offices_dict (dict[int, buildings.Office]): Dictionary mapping location keys (y * width + x) to Office objects in the tilemap.
         __buildings (list[buildings.Building]): List of the buildings in the tilemap.
+        __building_locations (np.ndarray): (N, 2) array of the (x, y) location of each building, in placement order.
+        __building_colours (np.ndarray): (N, 3) array of the colour of each building, in placement order.
+        __building_tile_values (np.ndarray): (N,) array of the tile value of each building, in placement order.
         __num_houses (int): The number of houses to be placed on the tilemap.
         __num_offices (int): The number of offices to be placed on the tilemap.
         __current_houses (int): Current number of houses placed on the tilemap, initialised to 0.
         __current_offices (int): Current number of offices placed on the tilemap, initialised to 0.
+        __rng (np.random.Generator): Random number generator used to choose building locations.
+        __empty_tiles (np.ndarray | None): Cached flat indices of the empty tiles, None if it must be rebuilt from the map.
     """
     def __init__(self, display_obj: display.Display,
                  num_houses: int, num_offices: int,
@@ -55,16 +60,23 @@ class Tilemap:
         self.__building_height: int = building_height
         self.__size: tuple[int, int] = (int(self.__display.get_width() / building_width),
                                         int(self.__display.get_height() / building_height))
-        self.__map: np.ndarray = np.zeros(self.__size, dtype=int) # Array of 0s of size self.__size
+        # Array of 0s, one row per row of tiles so [y, x] indexing runs along memory, tile values fit in int8
+        self.__map: np.ndarray = np.zeros((self.__size[1], self.__size[0]), dtype=np.int8)
         self.__houses_list: list[buildings.House] = [] # More efficient downstream for insertion-ordered index access
         self.__offices_list: list[buildings.Office] = [] # More efficient downstream for insertion-ordered index access
-        self.__houses_dict: dict[tuple[int, int], buildings.House] = {}
-        self.__offices_dict: dict[tuple[int, int], buildings.Office] = {}
+        self.__houses_dict: dict[int, buildings.House] = {} # Int keys hash faster than (x, y) tuples
+        self.__offices_dict: dict[int, buildings.Office] = {}
         self.__buildings: list[buildings.Building] = []
         self.__num_houses: int = num_houses
         self.__num_offices: int = num_offices
+        # Building fields mirrored into arrays, allocated for the most buildings that can be placed
+        self.__building_locations: np.ndarray = np.empty((num_houses + num_offices, 2), dtype=np.int32)
+        self.__building_colours: np.ndarray = np.empty((num_houses + num_offices, 3), dtype=np.uint8)
+        self.__building_tile_values: np.ndarray = np.empty(num_houses + num_offices, dtype=np.int8)
         self.__current_houses: int = 0
         self.__current_offices: int = 0
+        self.__rng: np.random.Generator = np.random.default_rng()
+        self.__empty_tiles: np.ndarray | None = np.flatnonzero(self.__map == 0)
 
     def get_num_houses(self) -> int:
         """
@@ -93,21 +105,21 @@ class Tilemap:
         """
         return self.__offices_list
     
-    def get_houses_dict(self) -> dict[tuple[int, int], buildings.House]:
+    def get_houses_dict(self) -> dict[int, buildings.House]:
         """
-        Returns the dictionary mapping locations to House objects in the tilemap.
+        Returns the dictionary mapping location keys (y * width + x) to House objects in the tilemap.
 
         Returns:
-            dict[tuple[int, int], buildings.House]: The dictionary of houses by location.
+            dict[int, buildings.House]: The dictionary of houses by location key.
         """
         return self.__houses_dict
     
-    def get_offices_dict(self) -> dict[tuple[int, int], buildings.Office]:
+    def get_offices_dict(self) -> dict[int, buildings.Office]:
         """
-        Returns the dictionary mapping locations to Office objects in the tilemap.
+        Returns the dictionary mapping location keys (y * width + x) to Office objects in the tilemap.
 
         Returns:
-            dict[tuple[int, int], buildings.Office]: The dictionary of offices by location.
+            dict[int, buildings.Office]: The dictionary of offices by location key.
         """
         return self.__offices_dict
 
@@ -120,6 +132,15 @@ class Tilemap:
         """
         return self.__buildings
 
+    def get_building_locations(self) -> np.ndarray:
+        """
+        Returns the locations of the buildings placed on the tilemap.
+
+        Returns:
+            np.ndarray: An (N, 2) array of the (x, y) tile location of each building.
+        """
+        return self.__building_locations[:len(self.__buildings)]
+
     def get_home_from_location(self, location: tuple[int, int]) -> buildings.House:
         """
         Returns the house object from a coordinate location.
@@ -127,8 +148,9 @@ class Tilemap:
         Returns:
             buildings.House: The House object with the required location.
         """
+        x, y = location
         try:
-            return self.__houses_dict[location]
+            return self.__houses_dict[y * self.__size[0] + x]
         except KeyError:
             raise RuntimeError(f"No house found at location {location}")
 
@@ -139,8 +161,9 @@ class Tilemap:
         Returns:
             buildings.Office: The Office object with the required location.
         """
+        x, y = location
         try:
-            return self.__offices_dict[location]
+            return self.__offices_dict[y * self.__size[0] + x]
         except KeyError:
             raise RuntimeError(f"No office found at location {location}")
 
@@ -149,7 +172,7 @@ class Tilemap:
         Returns the state of the tilemap as an array.
         
         Returns:
-            np.ndarray: A 2D array representing the tilemap.
+            np.ndarray: A 2D (rows, columns) array representing the tilemap, indexed [y, x].
         """
         return self.__map
 
@@ -171,69 +194,103 @@ class Tilemap:
         """
         return self.__building_height
 
-    def __place_building(self, building_cls: buildings.Building, empty_locations: list[tuple[int, int]]) -> None:
+    def invalidate_empty_cache(self) -> None:
+        """
+        Marks the cached empty tiles as out of date, so they are found again from the map on the next render.
+        Must be called if the map array is changed from outside the tilemap.
+        """
+        self.__empty_tiles = None
+
+    def __place_building(self, building_cls: buildings.Building, location: tuple[int, int]) -> None:
         """
-        Places a building of the specified type on the tilemap at a random, empty location.
-        If location not empty, random values generated until an empty location is found.
+        Places a building of the specified type on the tilemap at the given empty location.
 
         Args:
             building_cls (buildings.Building): The type of building ofbject to place.
-            empty_locations (list[tuple[int, int]]): List of available empty locations on the tilemap.
+            location (tuple[int, int]): The empty location on the tilemap to place the building at.
         """
-        # No empty locations available
-        if not empty_locations:
-            return
-        
-        x, y = random.choice(empty_locations) # random empty location
+        x, y = location
         building = building_cls((x, y))
+        key: int = y * self.__size[0] + x # Location packed into one int for the location dictionaries
 
-        # NOTE
-        # [x, y] flipped due to differences in coordinate systems in Python/ NumPy and Pygame
-        # Python/ NumPy: first index = row (y), second index = column (x)
-        # Pygame: first index = column (x), second index = row (y)
         if isinstance(building, buildings.House) and self.__current_houses < self.__num_houses:
-            self.__houses_dict[building.get_location()] = building # Store house by location for fast lookup
+            self.__houses_dict[key] = building # Store house by location for fast lookup
             self.__houses_list.append(building) # Append to list of houses
             self.__current_houses += 1
         elif isinstance(building, buildings.Office) and self.__current_offices < self. __num_offices:
-            self.__offices_dict[building.get_location()] = building # Store office by location for fast lookup
+            self.__offices_dict[key] = building # Store office by location for fast lookup
             self.__offices_list.append(building) # Append to list of offices
             self.__current_offices += 1
         else:
             return # Do not place building if max count reached
         
+        i: int = len(self.__buildings) # Index of the building in the building arrays
+        self.__building_locations[i] = location # Record location so the road graph needs no scan of the map
+        self.__building_colours[i] = building_cls.COLOUR # Class constants, no method call per building
+        self.__building_tile_values[i] = building_cls.TILE_VALUE
         self.__buildings.append(building) # Add to list of buildings
-        self.__map[y, x] = building.get_tile_value() # Update tilemap array
-        empty_locations.remove((x, y))
 
     def render(self, pause: bool) -> None:
         """
         Renders all buildings on the display.
         Draws each building as a rectangle on the display surface using its location and dimensions.
+        Without pause, all buildings are blitted in one batch from a tile surface filled once per colour.
 
         Args:
             pause (bool): True if display process to be shown, False if not.
         """
-        # Get empty locations on the tilemap
-        empty_locations: list[tuple[int, int]] = [(x, y)
-                                                  for x in range(self.__size[0])
-                                                  for y in range(self.__size[1])
-                                                  if self.__map[y, x] == 0]
-
-        # Loop through number of houses, offices and place on tilemap
-        for building_cls, max_count in [(buildings.House, self.__num_houses),
-                                        (buildings.Office, self.__num_offices),]:
-            for _ in range(max_count):
-                self.__place_building(building_cls, empty_locations)
-
-        for building in self.__buildings:
-            x, y = building.get_location()
-            pygame.draw.rect(self.__display.get_screen(), # Display surface
-                             building.get_colour(), # Colour
-                             (x * self.__building_width, # Top left coord
-                              y * self.__building_height, # Top right coord
-                              self.__building_width, # Bottom left coord
-                              self.__building_height)) # Bottom right coord
-            if pause:
-                self.__display.update()
-                pygame.time.wait(2) # Wait to show drawing process
+        # Flat indices of the empty tiles on the tilemap, only scanned for if the cache is out of date
+        if self.__empty_tiles is None:
+            self.__empty_tiles = np.flatnonzero(self.__map == 0)
+
+        # Choose every remaining building location at once, without replacement so no tile is chosen twice
+        houses_left: int = self.__num_houses - self.__current_houses
+        num_buildings: int = min(houses_left + self.__num_offices - self.__current_offices,
+                                 self.__empty_tiles.size) # May run out of tiles
+        picked: np.ndarray = self.__rng.choice(self.__empty_tiles.size, size=num_buildings, replace=False)
+        chosen: np.ndarray = self.__empty_tiles[picked]
+        self.__empty_tiles = np.delete(self.__empty_tiles, picked) # Chosen tiles are no longer empty
+        ys, xs = np.divmod(chosen, self.__map.shape[1]) # Flat indices back to [y, x]
+
+        # Houses placed first, then offices, in the chosen locations
+        for i, location in enumerate(zip(xs.tolist(), ys.tolist())):
+            building_cls = buildings.House if i < houses_left else buildings.Office
+            self.__place_building(building_cls, location)
+
+        num_placed: int = len(self.__buildings)
+        locations: np.ndarray = self.__building_locations[:num_placed]
+        # NOTE
+        # [x, y] flipped due to differences in coordinate systems in Python/ NumPy and Pygame
+        # Python/ NumPy: first index = row (y), second index = column (x)
+        # Pygame: first index = column (x), second index = row (y)
+        self.__map[locations[:, 1], locations[:, 0]] = self.__building_tile_values[:num_placed] # Update tilemap array
+
+        screen: pygame.Surface = self.__display.get_screen()
+
+        if pause:
+            self.__display.update() # Show the whole screen once, batches below only update the areas drawn
+            drawn_rects: list[pygame.Rect] = [] # Areas drawn since the last display update
+            for i, building in enumerate(self.__buildings, start=1):
+                x, y = building.get_location()
+                drawn_rects.append(pygame.draw.rect(screen, # Display surface
+                                                    building.COLOUR, # Colour
+                                                    (x * self.__building_width, # Top left coord
+                                                     y * self.__building_height, # Top right coord
+                                                     self.__building_width, # Bottom left coord
+                                                     self.__building_height))) # Bottom right coord
+                if i % PAUSE_BATCH == 0 or i == num_placed: # Update only the drawn areas, once per batch
+                    self.__display.update(drawn_rects)
+                    drawn_rects.clear()
+                    pygame.time.wait(2) # Wait to show drawing process
+            return
+
+        # One filled building-sized surface per colour, and which one each building uses
+        colours, colour_indices = np.unique(self.__building_colours[:num_placed], axis=0, return_inverse=True)
+        tiles: list[pygame.Surface] = []
+        for colour in colours.tolist():
+            tiles.append(pygame.Surface((self.__building_width, self.__building_height)))
+            tiles[-1].fill(colour)
+
+        positions: np.ndarray = locations * (self.__building_width, self.__building_height) # Top left of each building
+        screen.blits([(tiles[c], position) for c, position in zip(colour_indices.ravel().tolist(), positions.tolist())],
+                     doreturn=False) # Single call draws every building